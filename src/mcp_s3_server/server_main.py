@@ -24,90 +24,207 @@ try:
     from mcp import types
     logger.info("MCP imports successful")
 except ImportError as e:
-    logger.error(f"Import failed: {e}")
+    logger.error("Import failed: %s", e)
     sys.exit(1)
 
 from mcp_s3_server.tools.list_buckets_tool import list_buckets_tool
+from mcp_s3_server.tools.list_object_tool import list_objects_tool
+from mcp_s3_server.tools.download_file_tool import download_file_tool
 from mcp_s3_server.config import S3Config
+from mcp_s3_server.utils.utils import IS_CONFIGURED, close_s3_clients
 
 
 # Create server instance
 app = Server("mcp-s3-server")
 
 
+# Tool definitions are static, so build them once at import time instead of
+# reconstructing the schema dicts on every list_tools RPC.
+_EMPTY_SCHEMA = {"type": "object", "properties": {}, "required": []}
+
+_TOOLS_CACHE = (
+    types.Tool(
+        name="test_connection",
+        description="Test MCP S3 server connection",
+        inputSchema=_EMPTY_SCHEMA,
+    ),
+    types.Tool(
+        name="list_s3_buckets",
+        description=(
+            "List all S3 buckets in your storage account (supports AWS S3, "
+            "DigitalOcean Spaces, IBM Cloud Object Storage, and other "
+            "S3-compatible services)"
+        ),
+        inputSchema=_EMPTY_SCHEMA,
+    ),
+    types.Tool(
+        name="list_s3_objects",
+        description=(
+            "List objects in an S3 bucket, optionally filtered by key prefix. "
+            "Pages through results automatically when more than 1000 objects "
+            "are requested."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bucket_name": {
+                    "type": "string",
+                    "description": "Name of the S3 bucket to list objects from",
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": "Only list objects whose keys start with this prefix",
+                },
+                "max_keys": {
+                    "type": "integer",
+                    "description": "Maximum number of objects to return (default 1000)",
+                },
+                "delimiter": {
+                    "type": "string",
+                    "description": "Group keys by this delimiter (e.g. '/') and list the groups as folders",
+                },
+            },
+            "required": ["bucket_name"],
+        },
+    ),
+    types.Tool(
+        name="download_s3_file",
+        description=(
+            "Download an object from an S3 bucket to the local Downloads "
+            "folder. Large objects are fetched as concurrent byte ranges."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bucket_name": {
+                    "type": "string",
+                    "description": "Name of the S3 bucket to download from",
+                },
+                "object_key": {
+                    "type": "string",
+                    "description": "Key of the object to download",
+                },
+                "local_filename": {
+                    "type": "string",
+                    "description": "Optional filename to save as (defaults to the object key's basename)",
+                },
+            },
+            "required": ["bucket_name", "object_key"],
+        },
+    ),
+)
+
+
 @app.list_tools()
 async def list_tools() -> List[types.Tool]:
     """List available tools."""
-    logger.info("Listing tools...")
-    return [
-        types.Tool(
-            name="test_connection",
-            description="Test MCP S3 server connection",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        types.Tool(
-            name="list_s3_buckets",
-            description=(
-                "List all S3 buckets in your storage account (supports AWS S3, "
-                "DigitalOcean Spaces, IBM Cloud Object Storage, and other "
-                "S3-compatible services)"
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-    ]
+    logger.debug("Listing tools...")
+    return list(_TOOLS_CACHE)
 
 
 s3_config = S3Config.from_environment()
 
+# Config is immutable for the process lifetime; warn once here instead of
+# re-checking credentials inside every tool call.
+if not IS_CONFIGURED:
+    logger.warning("S3 credentials not configured; S3 tools will return setup instructions")
+
+# Static responses shared across calls; only the text is constant, so each
+# call returns a fresh list around the same TextContent object.
+_CONTENT_TEST_CONN_OK = types.TextContent(
+    type="text",
+    text=(
+        "✅ SUCCESS! MCP S3 Server is working!\n\n"
+        "Connection established successfully. The server is ready for S3 operations."
+    ),
+)
+_UNKNOWN_TOOL_TEMPLATE = (
+    "❌ Unknown tool: {name}\n\n"
+    "Available tools: test_connection, list_s3_buckets, list_s3_objects, download_s3_file"
+)
+
+
+async def _handle_test_connection(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    return [_CONTENT_TEST_CONN_OK]
+
+
+async def _handle_list_buckets(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    return await list_buckets_tool(s3_config)
+
+
+async def _handle_list_objects(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    return await list_objects_tool(
+        s3_config,
+        bucket_name=arguments.get("bucket_name"),
+        prefix=arguments.get("prefix"),
+        max_keys=arguments.get("max_keys", 1000),
+        delimiter=arguments.get("delimiter"),
+    )
+
+
+async def _handle_download_file(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    return await download_file_tool(
+        s3_config,
+        bucket_name=arguments.get("bucket_name"),
+        object_key=arguments.get("object_key"),
+        local_filename=arguments.get("local_filename"),
+    )
+
+
+# O(1) name lookup instead of an if/elif chain that grows with the tool set
+_DISPATCH = {
+    "test_connection": _handle_test_connection,
+    "list_s3_buckets": _handle_list_buckets,
+    "list_s3_objects": _handle_list_objects,
+    "download_s3_file": _handle_download_file,
+}
+
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls."""
-    logger.info(f"Tool called: {name}")
+    logger.info("Tool called: %s", name)
 
-    if name == "test_connection":
+    handler = _DISPATCH.get(name)
+    if handler is None:
         return [
-            types.TextContent(
-                type="text",
-                text=(
-                    "✅ SUCCESS! MCP S3 Server is working!\n\n"
-                    "Connection established successfully. The server is ready for S3 operations."
-                ),
-            )
+            types.TextContent(type="text", text=_UNKNOWN_TOOL_TEMPLATE.format(name=name))
         ]
-
-    if name == "list_s3_buckets":
-        return await list_buckets_tool(s3_config)
-
-    return [
-        types.TextContent(
-            type="text",
-            text=(
-                "❌ Unknown tool: {name}\n\nAvailable tools: test_connection, list_s3_buckets"
-            ).format(name=name),
-        )
-    ]
+    return await handler(arguments)
 
 
 async def _main_async() -> None:
     """Run the stdio MCP server."""
     logger.info("Starting MCP S3 Server (package entry point)...")
-    async with stdio_server() as (read_stream, write_stream):
-        logger.info("STDIO server established, running...")
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            logger.info("STDIO server established, running...")
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options(),
+            )
+    finally:
+        await close_s3_clients()
 
 
 def main() -> None:
+    # The default Windows Proactor loop busy-polls while idle; the selector
+    # loop keeps idle CPU near zero. Elsewhere, prefer uvloop when available.
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
     try:
         asyncio.run(_main_async())
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:  # noqa: BLE001 - log and exit non-zero
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -0,0 +1,239 @@
+import asyncio
+import os
+import sys
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+# Initialize logger before any use
+logger = logging.getLogger(__name__)
+
+try:
+    from mcp import types
+    from botocore.exceptions import ClientError, NoCredentialsError
+    logger.info("MCP and AWS imports successful")
+except ImportError as e:
+    logger.error("Import failed: %s", e)
+    sys.exit(1)
+
+from mcp_s3_server.config import S3Config
+from mcp_s3_server.utils.utils import IS_CONFIGURED, SERVICE_NAME, format_size, get_s3_client
+
+# Constant error payloads, built once instead of per call
+_CONTENT_NO_CREDS = types.TextContent(
+    type="text",
+    text="❌ S3 credentials not configured!\n\nPlease set the following environment variables in your Claude Desktop config:\n• AWS_ACCESS_KEY_ID (your access key)\n• AWS_SECRET_ACCESS_KEY (your secret key)\n• AWS_DEFAULT_REGION (optional, defaults to us-east-1)\n• S3_ENDPOINT_URL (optional, for S3-compatible services like DigitalOcean Spaces)"
+)
+_CONTENT_MISSING_BUCKET = types.TextContent(
+    type="text",
+    text="❌ Missing required parameter: bucket_name\n\nPlease specify the bucket to download from."
+)
+_CONTENT_MISSING_OBJECT_KEY = types.TextContent(
+    type="text",
+    text="❌ Missing required parameter: object_key\n\nPlease specify the key of the object to download."
+)
+
+# S3 recommends 8-16 MiB byte-range fetches in parallel for large objects.
+_CHUNK_SIZE = 16 * 1024 * 1024
+_MAX_CONCURRENCY = 8
+
+if hasattr(os, 'pwrite'):
+    def _write_at(fd: int, data: bytes, offset: int) -> None:
+        # pwrite may write fewer bytes than asked (signal interruption,
+        # near-full disk); loop until the whole chunk has landed.
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            offset += written
+            view = view[written:]
+else:
+    # os.pwrite is Unix-only; on Windows serialize seek+write pairs so
+    # concurrent chunks cannot interleave on the shared descriptor.
+    _write_at_lock = threading.Lock()
+
+    def _write_at(fd: int, data: bytes, offset: int) -> None:
+        with _write_at_lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+
+
+async def _download_ranged(
+    s3_client,
+    bucket_name: str,
+    object_key: str,
+    local_file_path: str,
+    content_length: int,
+) -> None:
+    """Fetch an object as concurrent 16 MiB ranged GETs.
+
+    Each chunk is written at its offset in the default executor, so large
+    writes never block the event loop thread.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENCY)
+    fd = os.open(local_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    async def fetch_range(offset: int) -> None:
+        end = min(offset + _CHUNK_SIZE, content_length) - 1
+        # The write stays inside the semaphore slot so a slow disk
+        # backpressures the GETs: at most _MAX_CONCURRENCY chunk buffers
+        # are ever held in memory.
+        async with semaphore:
+            response = await s3_client.get_object(
+                Bucket=bucket_name,
+                Key=object_key,
+                Range=f"bytes={offset}-{end}",
+            )
+            data = await response['Body'].read()
+            await loop.run_in_executor(None, _write_at, fd, data, offset)
+
+    tasks = [
+        asyncio.create_task(fetch_range(offset))
+        for offset in range(0, content_length, _CHUNK_SIZE)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # gather does not cancel siblings on failure; reap them all before
+        # the descriptor closes so no task can write to a stale (or reused)
+        # fd number.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        os.close(fd)
+
+
+# Every platform resolves to ~/Downloads, so compute the path once at import
+# and only pay the mkdir lstat on the first download of the process.
+_DOWNLOADS_FOLDER = Path.home() / "Downloads"
+_downloads_folder_ready = False
+
+
+def _ensure_downloads_folder() -> None:
+    """Create the Downloads folder on first use."""
+    global _downloads_folder_ready
+    if not _downloads_folder_ready:
+        _DOWNLOADS_FOLDER.mkdir(parents=True, exist_ok=True)
+        _downloads_folder_ready = True
+
+
+def _safe_filename(object_key: str, local_filename: Optional[str]) -> str:
+    """Pick the save-as name, confined to the Downloads folder.
+
+    A caller-supplied name is reduced to its basename so absolute or
+    ``../`` paths cannot escape Downloads; without one, the object key's
+    basename is used.
+    """
+    if local_filename:
+        local_filename = os.path.basename(local_filename)
+    if not local_filename:
+        local_filename = os.path.basename(object_key) or object_key
+    return local_filename
+
+
+async def download_file_tool(
+    s3_config: S3Config,
+    bucket_name: Optional[str],
+    object_key: Optional[str],
+    local_filename: Optional[str] = None,
+) -> List[types.TextContent]:
+    try:
+        # Credentials are immutable for the process; checked once at import
+        if not IS_CONFIGURED:
+            return [_CONTENT_NO_CREDS]
+
+        if not bucket_name:
+            return [_CONTENT_MISSING_BUCKET]
+
+        if not object_key:
+            return [_CONTENT_MISSING_OBJECT_KEY]
+
+        service_name = SERVICE_NAME
+        logger.info("Downloading '%s' from bucket '%s' (%s)...", object_key, bucket_name, service_name)
+
+        s3_client = await get_s3_client()
+
+        # Kick the HEAD off immediately so its round trip overlaps the local
+        # folder/path setup below; its ContentLength plans the ranged GETs and
+        # sizes the success message without stat()ing the file afterwards.
+        head_task = asyncio.create_task(
+            s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        )
+
+        try:
+            _ensure_downloads_folder()
+            local_filename = _safe_filename(object_key, local_filename)
+            local_file_path = str(_DOWNLOADS_FOLDER / local_filename)
+        except OSError:
+            # Reap the in-flight HEAD before reporting the setup error, or
+            # the abandoned task logs "Task exception was never retrieved".
+            head_task.cancel()
+            try:
+                await head_task
+            except BaseException:  # noqa: BLE001 - the OSError is re-raised below
+                pass
+            raise
+
+        head = await head_task
+        file_size = head['ContentLength']
+
+        await _download_ranged(
+            s3_client,
+            bucket_name,
+            object_key,
+            local_file_path,
+            file_size,
+        )
+
+        size_str = format_size(file_size)
+
+        logger.info("Downloaded '%s' to '%s' (%s)", object_key, local_file_path, size_str)
+
+        return [types.TextContent(
+            type="text",
+            text=f"✅ Download complete!\n\n📄 **{object_key}**\n   Bucket: {bucket_name}\n   Saved to: {local_file_path}\n   Size: {size_str}"
+        )]
+
+    except NoCredentialsError:
+        logger.error("S3 credentials not found")
+        return [_CONTENT_NO_CREDS]
+
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+
+        logger.error("AWS ClientError: %s - %s", error_code, error_message)
+
+        if error_code in ('NoSuchKey', '404'):
+            return [types.TextContent(
+                type="text",
+                text=f"❌ Object not found: '{object_key}'\n\nPlease check the object key and that it exists in bucket '{bucket_name}'."
+            )]
+        elif error_code == 'NoSuchBucket':
+            return [types.TextContent(
+                type="text",
+                text=f"❌ Bucket not found: '{bucket_name}'\n\nPlease check the bucket name and that it exists in {SERVICE_NAME}."
+            )]
+        elif error_code == 'AccessDenied':
+            return [types.TextContent(
+                type="text",
+                text=f"❌ Access denied: {error_message}\n\nPlease check that your credentials have the 'GetObject' permission for '{bucket_name}'."
+            )]
+        else:
+            return [types.TextContent(
+                type="text",
+                text=f"❌ {SERVICE_NAME} Error ({error_code}): {error_message}\n\nPlease check your configuration and try again."
+            )]
+
+    except Exception as e:
+        logger.error("Unexpected error downloading S3 file: %s", e, exc_info=True)
+        return [types.TextContent(
+            type="text",
+            text=f"❌ Unexpected error: {str(e)}\n\nPlease check the server logs for more details."
+        )]
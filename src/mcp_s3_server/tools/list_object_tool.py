@@ -0,0 +1,168 @@
+import asyncio
+import sys
+import logging
+from typing import List, Optional
+
+# Initialize logger before any use
+logger = logging.getLogger(__name__)
+
+try:
+    from mcp import types
+    from botocore.exceptions import ClientError, NoCredentialsError
+    logger.info("MCP and AWS imports successful")
+except ImportError as e:
+    logger.error("Import failed: %s", e)
+    sys.exit(1)
+
+from mcp_s3_server.config import S3Config
+from mcp_s3_server.utils.utils import IS_CONFIGURED, SERVICE_NAME, format_size, format_timestamp, get_s3_client
+
+# Constant error payloads, built once instead of per call
+_CONTENT_NO_CREDS = types.TextContent(
+    type="text",
+    text="❌ S3 credentials not configured!\n\nPlease set the following environment variables in your Claude Desktop config:\n• AWS_ACCESS_KEY_ID (your access key)\n• AWS_SECRET_ACCESS_KEY (your secret key)\n• AWS_DEFAULT_REGION (optional, defaults to us-east-1)\n• S3_ENDPOINT_URL (optional, for S3-compatible services like DigitalOcean Spaces)"
+)
+_CONTENT_MISSING_BUCKET = types.TextContent(
+    type="text",
+    text="❌ Missing required parameter: bucket_name\n\nPlease specify the bucket to list objects from."
+)
+
+
+async def list_objects_tool(
+    s3_config: S3Config,
+    bucket_name: Optional[str],
+    prefix: Optional[str] = None,
+    max_keys: int = 1000,
+    delimiter: Optional[str] = None,
+) -> List[types.TextContent]:
+    try:
+        # Credentials are immutable for the process; checked once at import
+        if not IS_CONFIGURED:
+            return [_CONTENT_NO_CREDS]
+
+        if not bucket_name:
+            return [_CONTENT_MISSING_BUCKET]
+
+        service_name = SERVICE_NAME
+        logger.info("Listing objects in '%s' from %s...", bucket_name, service_name)
+        logger.debug("Prefix: %s, max_keys: %d", prefix or '(none)', max_keys)
+
+        s3_client = await get_s3_client()
+
+        # Walk list_objects_v2 continuation tokens ourselves so requests
+        # beyond the 1000-key API limit return complete results, and prefetch
+        # the next page while the current one is being formatted — pages spend
+        # their RTT overlapped with local string work instead of serialized
+        # behind it. With a delimiter, S3 rolls grouped keys up into
+        # CommonPrefixes, which keeps folder-style browsing responses small.
+        list_kwargs = {
+            'Bucket': bucket_name,
+            'Prefix': prefix or '',
+        }
+        if delimiter:
+            list_kwargs['Delimiter'] = delimiter
+
+        async def fetch_page(token, remaining):
+            params = dict(list_kwargs, MaxKeys=min(remaining, 1000))
+            if token:
+                params['ContinuationToken'] = token
+            return await s3_client.list_objects_v2(**params)
+
+        # Rows are rendered per page with one f-string per object and a
+        # single join at the end. format_timestamp is memoized, so objects
+        # sharing a modification second reuse the same rendered string.
+        object_rows = []
+        prefixes = []
+        total_objects = 0
+        truncated = False
+        next_task = asyncio.create_task(fetch_page(None, max_keys))
+        while next_task is not None:
+            page = await next_task
+            contents = page.get('Contents', [])
+            first_index = total_objects + 1
+            total_objects += len(contents)
+
+            remaining = max_keys - total_objects
+            if page.get('IsTruncated') and remaining > 0:
+                next_task = asyncio.create_task(
+                    fetch_page(page.get('NextContinuationToken'), remaining)
+                )
+            else:
+                # Only flag truncation when we stopped at the max_keys cap
+                # with S3 reporting more results behind the last page.
+                truncated = bool(page.get('IsTruncated'))
+                next_task = None
+
+            prefixes.extend(page.get('CommonPrefixes', []))
+            object_rows.extend(
+                f"{i}. **{obj['Key']}**\n"
+                f"   Size: {format_size(obj['Size'])}\n"
+                f"   Modified: {format_timestamp(obj['LastModified'])}\n"
+                for i, obj in enumerate(contents, first_index)
+            )
+
+        logger.info("Found %d objects, %d common prefixes", total_objects, len(prefixes))
+
+        if not object_rows and not prefixes:
+            return [types.TextContent(
+                type="text",
+                text=f"📄 No objects found in bucket '{bucket_name}'" + (f" with prefix '{prefix}'" if prefix else "") + "."
+            )]
+
+        sections = []
+
+        if prefixes:
+            folder_lines = "\n".join(
+                f"{i}. 📁 **{p['Prefix']}**" for i, p in enumerate(prefixes, 1)
+            )
+            sections.append(f"📁 **Found {len(prefixes)} folder(s) in '{bucket_name}':**\n\n{folder_lines}\n")
+
+        if object_rows:
+            header = f"📄 **Found {total_objects} object(s) in '{bucket_name}':**\n"
+            body = "\n".join(object_rows)
+
+            footer = ""
+            if truncated:
+                footer = f"\n⚠️ Showing the first {max_keys} objects; more exist. Increase max_keys or narrow the prefix to see the rest."
+
+            sections.append(f"{header}\n{body}{footer}")
+
+        result_text = "\n".join(sections)
+
+        return [types.TextContent(
+            type="text",
+            text=result_text
+        )]
+
+    except NoCredentialsError:
+        logger.error("S3 credentials not found")
+        return [_CONTENT_NO_CREDS]
+
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+
+        logger.error("AWS ClientError: %s - %s", error_code, error_message)
+
+        if error_code == 'NoSuchBucket':
+            return [types.TextContent(
+                type="text",
+                text=f"❌ Bucket not found: '{bucket_name}'\n\nPlease check the bucket name and that it exists in {SERVICE_NAME}."
+            )]
+        elif error_code == 'AccessDenied':
+            return [types.TextContent(
+                type="text",
+                text=f"❌ Access denied: {error_message}\n\nPlease check that your credentials have the 'ListBucket' permission for '{bucket_name}'."
+            )]
+        else:
+            return [types.TextContent(
+                type="text",
+                text=f"❌ {SERVICE_NAME} Error ({error_code}): {error_message}\n\nPlease check your configuration and try again."
+            )]
+
+    except Exception as e:
+        logger.error("Unexpected error listing S3 objects: %s", e, exc_info=True)
+        return [types.TextContent(
+            type="text",
+            text=f"❌ Unexpected error: {str(e)}\n\nPlease check the server logs for more details."
+        )]
@@ -1,9 +1,49 @@
+import asyncio
+import functools
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
 import aioboto3
 from mcp_s3_server.config import S3Config
 
 # Global S3 config
 s3_config = S3Config.from_environment()
 
+# Config is immutable for the life of the process, so derive these once at
+# import instead of re-evaluating them on every tool call.
+CLIENT_KWARGS = {'endpoint_url': s3_config.endpoint_url} if s3_config.endpoint_url else {}
+SERVICE_NAME = s3_config.get_service_name()
+IS_CONFIGURED = s3_config.is_configured()
+
+# Long-lived S3 clients keyed by (endpoint_url, region) so repeated tool calls
+# reuse the same connection pool instead of paying botocore client construction
+# and TLS handshake costs on every request.
+_s3_clients: Dict[Tuple[Optional[str], str], Any] = {}
+_s3_clients_lock = asyncio.Lock()
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def format_size(n: int) -> str:
+    """Format a byte count as a human-readable string (e.g. '1.5 MB')."""
+    # bit_length() // 10 picks the unit without a comparison ladder, since
+    # each unit step is a factor of 1 << 10.
+    idx = min(max(0, (n.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if idx == 0:
+        return f"{n} B"
+    return f"{n / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(dt: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS UTC', memoized per value.
+
+    Bulk-uploaded objects often share a modification second, so the cache
+    turns repeated strftime calls in listing loops into dict hits.
+    """
+    return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
+
 
 async def get_s3_session() -> aioboto3.Session:
     """Create S3 session with credentials from global config."""
@@ -13,3 +53,25 @@ async def get_s3_session() -> aioboto3.Session:
         region_name=s3_config.region,
         aws_session_token=s3_config.session_token
     )
+
+
+async def get_s3_client() -> Any:
+    """Return a shared long-lived S3 client, creating it on first use."""
+    key = (s3_config.endpoint_url, s3_config.region)
+    client = _s3_clients.get(key)
+    if client is None:
+        async with _s3_clients_lock:
+            client = _s3_clients.get(key)
+            if client is None:
+                session = await get_s3_session()
+                client = await session.client('s3', **CLIENT_KWARGS).__aenter__()
+                _s3_clients[key] = client
+    return client
+
+
+async def close_s3_clients() -> None:
+    """Close any S3 clients opened during the server's lifetime."""
+    async with _s3_clients_lock:
+        while _s3_clients:
+            _, client = _s3_clients.popitem()
+            await client.__aexit__(None, None, None)
@@ -2,6 +2,8 @@
 
 import pytest
 from mcp_s3_server.config import S3Config
+from mcp_s3_server.tools.download_file_tool import _safe_filename
+from mcp_s3_server.utils.utils import format_size
 
 
 def test_s3_config_creation():
@@ -35,3 +37,22 @@ def test_s3_config_configured():
     config.access_key_id = "test"
     config.secret_access_key = "test"
     assert config.is_configured()
+
+
+def test_format_size():
+    """Test human-readable size formatting."""
+    assert format_size(0) == "0 B"
+    assert format_size(1023) == "1023 B"
+    assert format_size(1024) == "1.0 KB"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(1024 * 1024) == "1.0 MB"
+    assert format_size(5 * 1024 * 1024 * 1024) == "5.0 GB"
+
+
+def test_safe_filename():
+    """Caller-supplied filenames cannot escape the Downloads folder."""
+    assert _safe_filename("data/report.pdf", None) == "report.pdf"
+    assert _safe_filename("key", "notes.txt") == "notes.txt"
+    assert _safe_filename("key", "/home/user/.bashrc") == ".bashrc"
+    assert _safe_filename("key", "../../.ssh/config") == "config"
+    assert _safe_filename("data/report.pdf", "nested/") == "report.pdf"